@@ -17,13 +17,20 @@
 """
 
 # Standard
-from contextlib import contextmanager
-from io import BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from io import BytesIO, RawIOBase
 from threading import Lock
 from typing import Union
+from weakref import WeakKeyDictionary
 import errno
+import hashlib
 import os
+import shutil
+import stat
+import sys
 import tempfile
+import threading
 import zipfile
 
 # First Party
@@ -66,7 +73,22 @@ class ModelManager:
         """Initialize ModelManager."""
         # Map to store module caches, to be used for singleton model lookups
         self.singleton_module_cache = {}
-        self._singleton_lock = Lock()
+        # Guards singleton cache mutations; loads themselves never run under
+        # it, so the hold times are O(1)
+        self._singleton_meta_lock = Lock()
+        # Cached snapshot of the configured load backends so repeated loads
+        # don't rebuild it. Invalidated when the backend config changes.
+        self._backends_cache_token = None
+        self._backends_cache = None
+        # True when every backend in the cached snapshot is a shared loader,
+        # enabling the specialized load loop
+        self._backends_all_shared = False
+        # Per-class cache of the supported load backends, keyed weakly so that
+        # dynamically created module classes can still be collected
+        self._supported_backends_cache = WeakKeyDictionary()
+        # Per-thread pool of open archive handles; thread-local storage avoids
+        # a shared lock since ZipFile handles can't be shared across threads
+        self._zip_pool = threading.local()
 
     # make load function available from top-level of library
     def load(self, module_path, *args, load_singleton=False, **kwargs):
@@ -94,25 +116,76 @@ class ModelManager:
         """
         error.type_check("<COR98255724E>", bool, load_singleton=load_singleton)
 
-        # This allows a user to load their own model (e.g. model saved to disk)
-        load_path = get_config().load_path
-        if load_path is not None and isinstance(module_path, str):
-            if not os.path.exists(module_path):
-                module_path = os.path.join(load_path, module_path)
-
         # Ensure that we have a loadable directory.
         error.type_check("<COR98255419E>", str, BytesIO, bytes, module_path=module_path)
+
+        # For paths on disk, a single stat covers the exists/isdir/isfile
+        # questions asked along the load path rather than one syscall each
+        module_stat = None
         if isinstance(module_path, str):
             # Ensure this path is operating system correct if it isn't already.
             module_path = os.path.normpath(module_path)
+            module_stat = _try_stat(module_path)
+            # This allows a user to load their own model (e.g. model saved to disk)
+            load_path = get_config().load_path
+            if module_stat is None and load_path is not None:
+                module_path = os.path.normpath(os.path.join(load_path, module_path))
+                module_stat = _try_stat(module_path)
+            # Only regular files can be zip archives, so the stat lets us skip
+            # the is_zipfile probe (which reads the file) for directories
+            is_zip = (
+                module_stat is not None
+                and stat.S_ISREG(module_stat.st_mode)
+                and zipfile.is_zipfile(module_path)
+            )
         # If we have bytes, convert to a buffer, since we already handle in memory binary streams.
         elif isinstance(module_path, bytes):
+            # Sniff the 4-byte zip magic ("PK\x05\x06" is an empty archive)
+            # rather than running is_zipfile, which would scan the payload for
+            # the end-of-central-directory record. The BytesIO wrapper over
+            # bytes is copy-on-write, so no copy of the payload is made here.
+            is_zip = module_path[:4] in (b"PK\x03\x04", b"PK\x05\x06")
             module_path = BytesIO(module_path)
+        # BytesIO inputs get the same magic sniff on their underlying buffer,
+        # with no seek/read round-trip and no EOCD scan
+        else:
+            is_zip = bytes(module_path.getbuffer()[:4]) in (
+                b"PK\x03\x04",
+                b"PK\x05\x06",
+            )
+
+        # Canonicalize the singleton cache key so that logically equivalent
+        # inputs ("./m" vs "m", an archive re-extracted to a fresh temp dir,
+        # or the same in-memory payload) share a single cache entry. Only
+        # computed for singleton loads since realpath/hashing aren't free.
+        cache_key = None
+        if load_singleton:
+            if isinstance(module_path, str):
+                cache_key = os.path.realpath(module_path)
+            else:
+                cache_key = hashlib.blake2b(module_path.getbuffer()).hexdigest()
+            # Probe the cache before dispatching so that a singleton hit on an
+            # archive returns without opening or extracting the zip at all;
+            # the probe in _load_from_dir would only run after extraction
+            singleton_entry = self.singleton_module_cache.get(cache_key)
+            if singleton_entry is not None:
+                log.debug("Found %s in the singleton cache", module_path)
+                return _resolve_cache_entry(singleton_entry)
+
         # Now that we have a file like object | str we can try to load as an archive.
-        if zipfile.is_zipfile(module_path):
-            return self._load_from_zipfile(module_path, load_singleton, *args, **kwargs)
+        if is_zip:
+            return self._load_from_zipfile(
+                module_path, load_singleton, *args, _cache_key=cache_key, **kwargs
+            )
         try:
-            return self._load_from_dir(module_path, load_singleton, *args, **kwargs)
+            return self._load_from_dir(
+                module_path,
+                load_singleton,
+                *args,
+                _stat=module_stat,
+                _cache_key=cache_key,
+                **kwargs,
+            )
         except FileNotFoundError:
             error(
                 "<COR80419785E>",
@@ -123,7 +196,9 @@ class ModelManager:
                 ),
             )
 
-    def _load_from_dir(self, module_path, load_singleton, *args, **kwargs):
+    def _load_from_dir(
+        self, module_path, load_singleton, *args, _stat=None, _cache_key=None, **kwargs
+    ):
         """Load a model from a directory.
 
         Args:
@@ -132,165 +207,267 @@ class ModelManager:
                 about the model.
             load_singleton: bool
                 Indicates whether this model should be loaded as a singleton.
+            _stat: Optional[os.stat_result]
+                Result of an os.stat already done on module_path by the
+                caller, allowing the existence check here to be skipped.
+            _cache_key: Optional[str]
+                Canonical key to use for the singleton cache in place of
+                module_path, so that equivalent inputs share one entry.
 
         Returns:
             subclass of caikit.core.modules.ModuleBase
                 Model object that is loaded, configured, and ready for prediction.
         """
-        # Short-circuit the loading process if the path does not exist
-        if not os.path.exists(module_path):
+        # Fast path: a singleton cache hit costs one dict lookup and no lock.
+        # Dict reads are atomic under the GIL. An in-flight load for the same
+        # path is represented by a Future that we wait on rather than loading
+        # the model a second time.
+        cache_key = _cache_key if _cache_key is not None else module_path
+        if load_singleton:
+            singleton_entry = self.singleton_module_cache.get(cache_key)
+            if singleton_entry is not None:
+                log.debug("Found %s in the singleton cache", module_path)
+                return _resolve_cache_entry(singleton_entry)
+
+        # Short-circuit the loading process if the path does not exist.
+        # zipfile.Path inputs were already located inside their archive.
+        if (
+            _stat is None
+            and not isinstance(module_path, zipfile.Path)
+            and not os.path.exists(module_path)
+        ):
             raise FileNotFoundError(
                 errno.ENOENT, os.strerror(errno.ENOENT), module_path
             )
 
-        # If this is a singleton load, the entire body of this function needs to
-        # be locked to avoid concurrent loads on the same model. Otherwise, we
-        # can freely load in parallel.
-        with self.singleton_lock(load_singleton):
-
-            # Using the module_path as a key, look for an instance preloaded in the
-            # singleton cache if desired
-            # 🌶🌶🌶 This doesn't work for nested modules
-            # TODO: think about bringing back the `unique_hash` or `tracking_id`
-            if singleton_entry := (
-                load_singleton and self.singleton_module_cache.get(module_path)
-            ):
-                log.debug("Found %s in the singleton cache", module_path)
-                return singleton_entry
-
-            # Get the set of configured loaders
-            configured_load_backends = module_backend_config.configured_load_backends()
-            if not configured_load_backends:
-                log.info(
-                    "<COR56759744I>",
-                    "No backends configured! Configuring backends with current configuration",
-                )
-                module_backend_config.configure()
-                configured_load_backends = (
-                    module_backend_config.configured_load_backends()
-                )
+        # Non-singleton loads run with no locking at all
+        if not load_singleton:
+            return self._do_load(module_path, *args, **kwargs)
 
-            # Pre-initialize variables that will be parsed lazily from the
-            # ModuleConfig if needed. This is done lazily so that loaders which
-            # don't require a config.yml can take precedence over those that do
-            # require one.
-            module_id = None
-            module_implementations = None
-            model_creation_backend = None
-
-            # For each backend, if it's a shared loader, attempt to load the model
-            # directly. If not, parse the module config and look to see if there is
-            # a version of the module available for the given backend
-            loaded_model = None
-            log.debug("Available load backends: %s", configured_load_backends)
-            for i, load_backend in enumerate(configured_load_backends):
-                # If this is a shared loader, try loading the model directly
-                if isinstance(load_backend, SharedLoadBackendBase):
-                    log.debug("Trying shared backend loader")
-                    model = load_backend.load(module_path, *args, **kwargs)
-                    if model is not None:
-                        log.debug2(
-                            "Successfully loaded %s with loader (%d)%s",
-                            module_path,
-                            i,
-                            load_backend.backend_type,
-                        )
-                        error.type_check(
-                            "<COR76726077E>",
-                            ModuleBase,
-                            model=model,
-                        )
+        # On a singleton cache miss, hold the lock only long enough to install
+        # a Future as a sentinel for this load, then run the heavy load
+        # without any lock held. Concurrent callers for the same path wait on
+        # the future instead of queueing on a mutex.
+        # Using the module_path as a key, look for an instance preloaded in the
+        # singleton cache if desired
+        # 🌶🌶🌶 This doesn't work for nested modules
+        # TODO: think about bringing back the `unique_hash` or `tracking_id`
+        future = None
+        with self._singleton_meta_lock:
+            singleton_entry = self.singleton_module_cache.get(cache_key)
+            if singleton_entry is None:
+                future = Future()
+                self.singleton_module_cache[cache_key] = future
+        if future is None:
+            log.debug("Found %s in the singleton cache", module_path)
+            return _resolve_cache_entry(singleton_entry)
 
-                        loaded_model = model
-                        model.set_load_backend(load_backend)
-                        break
-                    log.debug3(
-                        "Could not load %s with loader (%d)%s",
+        try:
+            loaded_model = self._do_load(module_path, *args, **kwargs)
+        except BaseException as err:
+            # Remove the sentinel so that later calls can retry, then hand the
+            # error to any waiters
+            with self._singleton_meta_lock:
+                if self.singleton_module_cache.get(cache_key) is future:
+                    del self.singleton_module_cache[cache_key]
+            future.set_exception(err)
+            raise
+
+        # Publish the model in place of the sentinel. The cache attribute is
+        # re-read in case it was swapped out while the load was in flight.
+        with self._singleton_meta_lock:
+            cache = self.singleton_module_cache
+            if cache.get(cache_key) is future:
+                cache[cache_key] = loaded_model
+        future.set_result(loaded_model)
+        return loaded_model
+
+    def _do_load(self, module_path, *args, **kwargs):
+        """Run the configured load backends against the given path and return
+        the loaded model. This is the heavy part of a load and runs without
+        any locks held.
+
+        Args:
+            module_path:  str
+                Path to directory. At the top level of directory is `config.yml` which holds info
+                about the model.
+
+        Returns:
+            subclass of caikit.core.modules.ModuleBase
+                Model object that is loaded, configured, and ready for prediction.
+        """
+        # Get the set of configured loaders
+        configured_load_backends = self._get_load_backends()
+        if not configured_load_backends:
+            log.info(
+                "<COR56759744I>",
+                "No backends configured! Configuring backends with current configuration",
+            )
+            module_backend_config.configure()
+            configured_load_backends = self._get_load_backends()
+
+        # When every configured backend is a shared loader (the stock
+        # LOCAL-only configuration), run the specialized loop that skips all
+        # of the module-config bookkeeping below. The choice is made once per
+        # backend-config snapshot, not per load iteration.
+        if self._backends_all_shared:
+            return self._do_load_all_shared(
+                configured_load_backends, module_path, *args, **kwargs
+            )
+
+        # Pre-initialize variables that will be parsed lazily from the
+        # ModuleConfig if needed. This is done lazily so that loaders which
+        # don't require a config.yml can take precedence over those that do
+        # require one.
+        module_id = None
+        module_implementations = None
+        model_creation_backend = None
+
+        # For each backend, if it's a shared loader, attempt to load the model
+        # directly. If not, parse the module config and look to see if there is
+        # a version of the module available for the given backend
+        loaded_model = None
+        log.debug("Available load backends: %s", configured_load_backends)
+        for is_shared, backend_type, load_backend in configured_load_backends:
+            # If this is a shared loader, try loading the model directly
+            if is_shared:
+                log.debug("Trying shared backend loader")
+                model = load_backend.load(module_path, *args, **kwargs)
+                if model is not None:
+                    log.debug2(
+                        "Successfully loaded %s with loader %s",
                         module_path,
-                        i,
-                        load_backend.backend_type,
+                        backend_type,
+                    )
+                    error.type_check(
+                        "<COR76726077E>",
+                        ModuleBase,
+                        model=model,
                     )
 
-                # If this is not a shared loader, look for an implementation of the
-                # model's module that works with this backend
-                else:
-                    # If this is the first time parsing the module config, do so
-                    if module_id is None:
-                        log.debug2("Loading ModuleConfig from %s", module_path)
-                        module_config = ModuleConfig.load(module_path)
-                        module_id = module_config.module_id
-                        module_implementations = module_backend_registry().get(
-                            module_id, {}
-                        )
-                        log.debug2(
-                            "Number of available backend implementations for %s found: %d",
-                            module_id,
-                            len(module_implementations),
-                        )
-                        # Look up the backend that this model was created with
-                        model_creation_backend = module_config.get(
-                            "model_backend", backend_types.LOCAL
-                        )
+                    loaded_model = model
+                    model.set_load_backend(load_backend)
+                    break
+                log.debug3(
+                    "Could not load %s with loader %s",
+                    module_path,
+                    backend_type,
+                )
 
-                    # Look in the module's implementations for this backend type
-                    backend_impl_obj = module_implementations.get(
-                        load_backend.backend_type
+            # If this is not a shared loader, look for an implementation of the
+            # model's module that works with this backend
+            else:
+                # If this is the first time parsing the module config, do so
+                if module_id is None:
+                    log.debug2("Loading ModuleConfig from %s", module_path)
+                    module_id, model_creation_backend = self._peek_module_info(
+                        module_path
                     )
-                    if backend_impl_obj is None:
-                        log.debug3(
-                            "Module %s does not support loading with %s",
-                            module_id,
-                            load_backend.backend_type,
-                        )
-                        continue
-
-                    # Grab the concrete module class for this backend and check to
-                    # see if this model's artifacts were created with a version of
-                    # the module that can be loaded with this backend.
-                    module_backend_impl = backend_impl_obj.impl_class
-                    supported_load_backends = self._get_supported_load_backends(
-                        module_backend_impl
+                    module_implementations = module_backend_registry().get(
+                        module_id, {}
+                    )
+                    log.debug2(
+                        "Number of available backend implementations for %s found: %d",
+                        module_id,
+                        len(module_implementations),
+                    )
+
+                # Look in the module's implementations for this backend type
+                backend_impl_obj = module_implementations.get(backend_type)
+                if backend_impl_obj is None:
+                    log.debug3(
+                        "Module %s does not support loading with %s",
+                        module_id,
+                        backend_type,
                     )
-                    if model_creation_backend in supported_load_backends:
-                        log.debug3(
-                            "Attempting to load %s (module_id %s) with backend %s and class %s",
+                    continue
+
+                # Grab the concrete module class for this backend and check to
+                # see if this model's artifacts were created with a version of
+                # the module that can be loaded with this backend.
+                module_backend_impl = backend_impl_obj.impl_class
+                supported_load_backends = self._get_supported_load_backends(
+                    module_backend_impl
+                )
+                if model_creation_backend in supported_load_backends:
+                    log.debug3(
+                        "Attempting to load %s (module_id %s) with backend %s and class %s",
+                        module_path,
+                        module_id,
+                        backend_type,
+                        module_backend_impl.__name__,
+                    )
+                    loaded_model = module_backend_impl.load(
+                        module_path,
+                        *args,
+                        load_backend=load_backend,
+                        **kwargs,
+                    )
+                    if loaded_model is not None:
+                        log.debug2(
+                            "Successfully loaded %s with backend %s",
                             module_path,
-                            module_id,
-                            load_backend.backend_type,
-                            module_backend_impl.__name__,
+                            backend_type,
                         )
-                        loaded_model = module_backend_impl.load(
-                            module_path,
-                            *args,
-                            load_backend=load_backend,
-                            **kwargs,
-                        )
-                        if loaded_model is not None:
-                            log.debug2(
-                                "Successfully loaded %s with backend %s",
-                                module_path,
-                                load_backend.backend_type,
-                            )
-                            loaded_model.set_load_backend(load_backend)
-                            break
-
-            # If no model successfully loaded, it's an error
-            if loaded_model is None:
-                error(
-                    "<COR50207494E>",
-                    ValueError(
-                        f"Unable to load model from {module_path} with MODULE_ID {module_id}"
-                    ),
-                )
+                        loaded_model.set_load_backend(load_backend)
+                        break
 
-            # If loading as a singleton, populate the cache
-            if load_singleton:
-                self.singleton_module_cache[module_path] = loaded_model
+        # If no model successfully loaded, it's an error
+        if loaded_model is None:
+            error(
+                "<COR50207494E>",
+                ValueError(
+                    f"Unable to load model from {module_path} with MODULE_ID {module_id}"
+                ),
+            )
 
-            # Return successfully!
-            return loaded_model
+        # Return successfully!
+        return loaded_model
+
+    def _do_load_all_shared(
+        self, configured_load_backends, module_path, *args, **kwargs
+    ):
+        """Specialized version of the load loop for configurations where every
+        backend is a shared loader: each backend gets a direct load attempt
+        and none of the per-module implementation lookup is needed.
+
+        Args:
+            configured_load_backends: Tuple[Tuple[bool, str, BackendBase]]
+                Snapshot of the configured load backends from
+                `_get_load_backends`, all of which are shared loaders.
+            module_path:  str
+                Path to directory. At the top level of directory is `config.yml` which holds info
+                about the model.
+
+        Returns:
+            subclass of caikit.core.modules.ModuleBase
+                Model object that is loaded, configured, and ready for prediction.
+        """
+        log.debug("Available load backends: %s", configured_load_backends)
+        for _, backend_type, load_backend in configured_load_backends:
+            model = load_backend.load(module_path, *args, **kwargs)
+            if model is not None:
+                log.debug2(
+                    "Successfully loaded %s with loader %s",
+                    module_path,
+                    backend_type,
+                )
+                error.type_check("<COR66171660E>", ModuleBase, model=model)
+                model.set_load_backend(load_backend)
+                return model
+            log.debug3(
+                "Could not load %s with loader %s",
+                module_path,
+                backend_type,
+            )
+        error(
+            "<COR88356783E>",
+            ValueError(f"Unable to load model from {module_path} with MODULE_ID None"),
+        )
 
-    def _load_from_zipfile(self, module_path, load_singleton, *args, **kwargs):
+    def _load_from_zipfile(
+        self, module_path, load_singleton, *args, _cache_key=None, **kwargs
+    ):
         """Load a model from a zip archive.
 
         Args:
@@ -299,60 +476,151 @@ class ModelManager:
                 about the model.
             load_singleton: bool
                 Indicates whether this model should be loaded as a singleton.
+            _cache_key: Optional[str]
+                Canonical singleton cache key computed by `load` for the
+                original archive. Forwarded to `_load_from_dir` so that
+                singleton entries key on the archive itself rather than on the
+                per-load extraction directory.
 
         Returns:
             subclass of caikit.core.modules.ModuleBase
                 Model object that is loaded, configured, and ready for prediction.
         """
-        with tempfile.TemporaryDirectory() as extract_path:
-            with zipfile.ZipFile(module_path, "r") as zip_f:
-                zip_f.extractall(extract_path)
-            # Depending on the way the zip archive is packaged, out temp directory may unpack
-            # to files directly, or it may unpack to a (single) directory containing the files.
-            # We expect the former, but fall back to the second if we can't find the config.
-            try:
-                model = self._load_from_dir(
-                    extract_path, load_singleton, *args, **kwargs
-                )
-            # NOTE: Error handling is a little gross here, the main reason being that we
-            # only want to log to error() if something is fatal, and there are a good amount
-            # of things that can go wrong in this process.
-            except FileNotFoundError:
-
-                def get_full_path(folder_name):
-                    return os.path.join(extract_path, folder_name)
-
-                # Get the contained directories. Omit anything starting with __ to avoid
-                # accidentally traversing compression artifacts, e.g., __MACOSX.
-                nested_dirs = [
-                    get_full_path(f)
-                    for f in os.listdir(extract_path)
-                    if os.path.isdir(get_full_path(f)) and not f.startswith("__")
-                ]
-                # If we have multiple dirs, something is probably wrong - this doesn't look
-                # like a simple level of nesting as a result of creating the zip.
-                if len(nested_dirs) != 1:
-                    error(
-                        "<COR06761097E>",
-                        FileNotFoundError(
-                            "Unable to locate archive config due to nested dirs"
-                        ),
+        with ExitStack() as stack:
+            if isinstance(module_path, str):
+                # Reuse this thread's pooled handle for on-disk archives so
+                # repeated loads of the same archive (e.g. resolving
+                # sub-modules of a composite model) skip re-reading the
+                # central directory. Pooled handles are left open for reuse.
+                zip_f = self._get_zipfile(module_path)
+            else:
+                zip_f = stack.enter_context(zipfile.ZipFile(module_path, "r"))
+            # Probe the archive's central directory for the config before
+            # touching disk. Depending on the way the zip archive is packaged,
+            # it may unpack to files directly, or it may unpack to a (single)
+            # directory containing the files. We expect the former, but fall
+            # back to the second if we can't find the config at the root.
+            config_member = _find_archive_config(zip_f)
+            module_config = None
+            if config_member is not None:
+                # Stream the config straight out of the archive so we can learn
+                # about the module without waiting for a full extraction
+                try:
+                    module_config = ModuleConfig.load_from_bytes(
+                        zip_f.read(config_member)
+                    )
+                    log.debug2(
+                        "Archive config found at %s with module_id %s",
+                        config_member,
+                        module_config.module_id,
+                    )
+                # NOTE: A bad config here is not fatal since loaders that don't
+                # require a config.yml may still be able to load the archive
+                except Exception as err:  # pylint: disable=broad-except
+                    log.debug2(
+                        "Unable to pre-parse archive config %s: %s",
+                        config_member,
+                        err,
+                    )
+
+            # If the module declares that its load can read straight from a
+            # zipfile.Path, hand it one rooted at the model directory and skip
+            # extraction entirely
+            if module_config is not None:
+                module_class = module_registry().get(module_config.module_id)
+                if module_class is not None and getattr(
+                    module_class, "SUPPORTS_ZIP_PATH", False
+                ):
+                    log.debug2(
+                        "Loading module %s directly from the archive without "
+                        "extraction",
+                        module_config.module_id,
+                    )
+                    model_dir = os.path.dirname(config_member)
+                    zip_path = zipfile.Path(
+                        zip_f, at="{}/".format(model_dir) if model_dir else ""
+                    )
+                    return self._load_from_dir(
+                        zip_path, load_singleton, *args, _cache_key=_cache_key, **kwargs
+                    )
+
+            # Extract into a ramdisk when one is available with enough space;
+            # the extracted bytes are read right back by the loader, so there
+            # is no reason to round-trip them through disk
+            uncompressed_size = sum(info.file_size for info in zip_f.infolist())
+            with tempfile.TemporaryDirectory(
+                dir=_preferred_extract_dir(uncompressed_size)
+            ) as extract_path:
+                _extract_archive(zip_f, module_path, extract_path)
+
+                # If the probe found the config, we already know which
+                # directory holds the model, so load it directly
+                if config_member is not None:
+                    model_dir = os.path.dirname(config_member)
+                    model = self._load_from_dir(
+                        os.path.join(extract_path, model_dir)
+                        if model_dir
+                        else extract_path,
+                        load_singleton,
+                        *args,
+                        _cache_key=_cache_key,
+                        **kwargs,
                     )
-                # Otherwise, try again. If we fail again stop, because the zip creation should only
-                # create one potential extra layer of nesting around the model directory.
+                    return model
+
+                # Without a probed config location, fall back to trying the
+                # extraction root, then a single level of nesting.
                 try:
                     model = self._load_from_dir(
-                        nested_dirs[0], load_singleton, *args, **kwargs
+                        extract_path,
+                        load_singleton,
+                        *args,
+                        _cache_key=_cache_key,
+                        **kwargs,
                     )
+                # NOTE: Error handling is a little gross here, the main reason being that we
+                # only want to log to error() if something is fatal, and there are a good amount
+                # of things that can go wrong in this process.
                 except FileNotFoundError:
-                    error(
-                        "<COR84410081E>",
-                        FileNotFoundError(
-                            "Unable to locate archive config within top two levels of {}".format(
-                                module_path
-                            )
-                        ),
-                    )
+                    # Get the contained directories. Omit anything starting with __ to avoid
+                    # accidentally traversing compression artifacts, e.g., __MACOSX.
+                    # scandir gets the file type from the dirent itself, saving
+                    # the per-entry stat that listdir + isdir would do.
+                    with os.scandir(extract_path) as dir_entries:
+                        nested_dirs = [
+                            entry.path
+                            for entry in dir_entries
+                            if entry.is_dir(follow_symlinks=False)
+                            and not entry.name.startswith("__")
+                        ]
+                    # If we have multiple dirs, something is probably wrong - this doesn't look
+                    # like a simple level of nesting as a result of creating the zip.
+                    if len(nested_dirs) != 1:
+                        error(
+                            "<COR06761097E>",
+                            FileNotFoundError(
+                                "Unable to locate archive config due to nested dirs"
+                            ),
+                        )
+                    # Otherwise, try again. If we fail again stop, because the zip creation should
+                    # only create one potential extra layer of nesting around the model directory.
+                    try:
+                        model = self._load_from_dir(
+                            nested_dirs[0],
+                            load_singleton,
+                            *args,
+                            _cache_key=_cache_key,
+                            **kwargs,
+                        )
+                    except FileNotFoundError:
+                        error(
+                            "<COR84410081E>",
+                            FileNotFoundError(
+                                "Unable to locate archive config within top two levels of {}".format(
+                                    module_path
+                                )
+                            ),
+                        )
         return model
 
     def extract(self, zip_path, model_path, force_overwrite=False):
@@ -379,8 +647,9 @@ class ModelManager:
             )
             return model_path
 
-        with zipfile.ZipFile(zip_path, "r") as zip_f:
-            zip_f.extractall(model_path)
+        with open(zip_path, "rb", buffering=_ZIP_READ_BUFFER_SIZE) as zip_source:
+            with zipfile.ZipFile(zip_source, "r") as zip_f:
+                zip_f.extractall(model_path)
 
         # path to model
         return model_path
@@ -447,7 +716,13 @@ class ModelManager:
             Dict[str, type]
                 A dictionary of model hashes to model types
         """
-        return {k: type(v) for k, v in self.singleton_module_cache.items()}
+        # Iterate a snapshot so concurrent loads can't perturb the iteration,
+        # and skip sentinels for loads that are still in flight
+        return {
+            k: type(v)
+            for k, v in list(self.singleton_module_cache.items())
+            if not isinstance(v, Future)
+        }
 
     def clear_singleton_cache(self):
         """Clears the cache of singleton models. Useful to release references of models, as long as
@@ -456,19 +731,124 @@ class ModelManager:
         Returns:
             None
         """
-        with self._singleton_lock:
-            self.singleton_module_cache.clear()
+        # Swap in a fresh dict rather than clearing in place; the attribute
+        # store is atomic under the GIL, so no lock is needed and in-flight
+        # loads keep publishing into the old (now unreachable) dict. The
+        # publish path in _load_from_dir re-reads the attribute under the meta
+        # lock, so a model loaded across the swap is simply dropped with it.
+        self.singleton_module_cache = {}
+        # Also release any archive handles pooled by this thread. Handles
+        # pooled by other threads are released when those threads exit.
+        zip_cache = getattr(self._zip_pool, "cache", None)
+        if zip_cache:
+            for _, zip_handle in zip_cache.values():
+                zip_handle.close()
+            zip_cache.clear()
+
+    def _get_zipfile(self, zip_path):
+        """Get an open ZipFile for the given path, reusing a handle this
+        thread already opened when the file is unchanged on disk. Reuse skips
+        re-parsing the archive's central directory on repeated loads.
+
+        Args:
+            zip_path: str
+                Path to the zip archive on disk.
+
+        Returns:
+            zipfile.ZipFile
+                An open handle owned by this thread's pool. Callers must not
+                close it; the pool does so on clear_singleton_cache or thread
+                exit.
+        """
+        cache = getattr(self._zip_pool, "cache", None)
+        if cache is None:
+            cache = self._zip_pool.cache = {}
+        file_stat = os.stat(zip_path)
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        entry = cache.get(zip_path)
+        if entry is not None:
+            if entry[0] == stat_key:
+                return entry[1]
+            # The archive changed on disk; the pooled central directory is
+            # stale
+            entry[1].close()
+        zip_handle = zipfile.ZipFile(
+            # pylint: disable=consider-using-with
+            open(zip_path, "rb", buffering=_ZIP_READ_BUFFER_SIZE),
+            "r",
+        )
+        cache[zip_path] = (stat_key, zip_handle)
+        return zip_handle
+
+    def _peek_module_info(self, module_path):
+        """Resolve the module_id and creation backend for the model at the
+        given path as cheaply as possible. A header peek is tried first since
+        only the top-level module_id and model_backend fields are needed; the
+        full config load is the fallback for large configs and legacy
+        block/workflow/resource id handling.
+
+        Args:
+            module_path: str | zipfile.Path
+                Path to directory holding a top-level `config.yml`.
 
-    @contextmanager
-    def singleton_lock(self, load_singleton: bool):
-        """Helper contextmanager that will only lock the singleton cache if this
-        load is a singleton load
+        Returns:
+            Tuple[str, str]
+                The module_id and the backend the model was created with.
         """
-        if load_singleton:
-            with self._singleton_lock:
-                yield
-        else:
-            yield
+        if isinstance(module_path, zipfile.Path):
+            module_config = ModuleConfig.load(module_path)
+            return module_config.module_id, module_config.get(
+                "model_backend", backend_types.LOCAL
+            )
+        config_header = ModuleConfig.load_header(module_path)
+        if config_header is not None and config_header.get("module_id"):
+            return config_header["module_id"], config_header.get(
+                "model_backend", backend_types.LOCAL
+            )
+        module_config = ModuleConfig.load(module_path)
+        return module_config.module_id, module_config.get(
+            "model_backend", backend_types.LOCAL
+        )
+
+    def _get_load_backends(self):
+        """Get a cached snapshot of the configured load backends in priority
+        order. The snapshot is rebuilt when the backend configuration changes,
+        so repeated loads share the same tuple. Whether each backend is a
+        shared loader and its backend type are precomputed here so the load
+        loop does no isinstance checks or attribute lookups per backend.
+
+        Returns:
+            Tuple[Tuple[bool, str, BackendBase]]
+                (is_shared, backend_type, backend) triples in priority order
+        """
+        token = module_backend_config.config_version()
+        backends = tuple(module_backend_config.configured_load_backends())
+        # NOTE: The registries can also be manipulated directly without a call
+        # to configure() (notably by test fixtures), so the cache is validated
+        # against the snapshot itself in addition to the version token.
+        cached = self._backends_cache
+        if (
+            cached is not None
+            and self._backends_cache_token == token
+            and cached[0] == backends
+        ):
+            return cached[1]
+        triples = tuple(
+            (
+                isinstance(backend, SharedLoadBackendBase),
+                backend.backend_type,
+                backend,
+            )
+            for backend in backends
+        )
+        # Decide once per snapshot whether the all-shared specialization of
+        # the load loop applies (true for the stock LOCAL-only configuration)
+        self._backends_all_shared = bool(triples) and all(
+            is_shared for is_shared, _, _ in triples
+        )
+        self._backends_cache = (backends, triples)
+        self._backends_cache_token = token
+        return triples
 
     def _get_supported_load_backends(self, backend_impl: ModuleBase):
         """Function to get a list of supported load backends
@@ -478,14 +858,219 @@ class ModelManager:
             backend_impl: caikit.core.ModuleBase
                 Module implementing the backend
         Returns:
-            list(backend_types)
-                list of backends that are supported for model load
+            frozenset(backend_types)
+                set of backends that are supported for model load
         """
 
-        # Get list of backends that are supported for load
+        # Get the set of backends that are supported for load. The set is
+        # cached per module class since it is looked up once per backend for
+        # every load and the class attribute does not change after decoration.
         # NOTE: since code in a module can change anytime, its support
         # for various backend might also change, in which case,
         # it would be better to keep the backend information in the model itself
         # If module_backend is None, then we will assume that this model is not loadable in
         # any other backend
-        return getattr(backend_impl, SUPPORTED_LOAD_BACKENDS_VAR_NAME, [])
+        supported_backends = self._supported_backends_cache.get(backend_impl)
+        if supported_backends is None:
+            supported_backends = frozenset(
+                getattr(backend_impl, SUPPORTED_LOAD_BACKENDS_VAR_NAME, ())
+            )
+            self._supported_backends_cache[backend_impl] = supported_backends
+        return supported_backends
+
+
+# Size of the reusable per-thread copy buffer used when extracting archive
+# members. zlib releases the GIL while decompressing, so a few workers with
+# large buffers beat the sequential 8KB copies done by ZipFile.extractall on
+# the artifact-heavy archives that are typical for models.
+_EXTRACT_BUFFER_SIZE = 1 << 20
+_MAX_EXTRACT_WORKERS = 8
+
+# Buffer size used for the readers that feed ZipFile; the stdlib default of
+# 8KB multiplies syscall count on large archives
+_ZIP_READ_BUFFER_SIZE = 1 << 20
+
+
+def _resolve_cache_entry(entry):
+    """Resolve a singleton cache entry to a model, waiting on the result of
+    loads that are still in flight.
+    """
+    return entry.result() if isinstance(entry, Future) else entry
+
+
+def _try_stat(path):
+    """Stat the given path, returning None if it does not exist (or cannot be
+    reached), mirroring how os.path.exists swallows OSErrors.
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _preferred_extract_dir(uncompressed_size):
+    """Pick the directory to extract archives into. On Linux, prefer the
+    /dev/shm ramdisk when it exists and has room for the uncompressed archive
+    so extraction stays memory-bound. Admins can opt out with the
+    `tempfs_extract` config flag.
+
+    Args:
+        uncompressed_size: int
+            Total uncompressed size of the archive in bytes.
+
+    Returns:
+        Optional[str]
+            Directory to pass to TemporaryDirectory, or None for the OS
+            default temp directory.
+    """
+    if not get_config().tempfs_extract:
+        return None
+    if not sys.platform.startswith("linux") or not os.path.isdir("/dev/shm"):
+        return None
+    try:
+        free_space = shutil.disk_usage("/dev/shm").free
+    except OSError:
+        return None
+    return "/dev/shm" if free_space > uncompressed_size else None
+
+
+class _BufferReader(RawIOBase):
+    """Minimal read-only seekable file over a memoryview. Each instance keeps
+    its own cursor, so any number of readers can share one underlying buffer
+    across threads without copying it.
+    """
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._buffer = buffer
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_SET:
+            pos = offset
+        elif whence == os.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == os.SEEK_END:
+            pos = len(self._buffer) + offset
+        else:
+            raise ValueError("Invalid whence: {}".format(whence))
+        self._pos = max(0, pos)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, b):
+        read_size = min(len(b), len(self._buffer) - self._pos)
+        if read_size <= 0:
+            return 0
+        b[:read_size] = self._buffer[self._pos : self._pos + read_size]
+        self._pos += read_size
+        return read_size
+
+
+def _extract_archive(zip_f, zip_source, extract_path):
+    """Extract all members of an open zip archive into the given directory
+    using a pool of worker threads with large reusable copy buffers.
+
+    Args:
+        zip_f: zipfile.ZipFile
+            Already-open archive, used to enumerate the members to extract.
+        zip_source: str | BytesIO
+            Source the archive was opened from. ZipFile handles are not safe
+            for concurrent reads, so each worker thread opens its own handle:
+            a buffered file for on-disk paths, or a zero-copy _BufferReader
+            over the shared payload for in-memory archives.
+        extract_path: str
+            Directory to extract into.
+    """
+    root = os.path.realpath(extract_path)
+    members = []
+    for info in zip_f.infolist():
+        target = os.path.realpath(os.path.join(extract_path, info.filename))
+        # Mirror extractall's sanitization by refusing to write outside of the
+        # extraction root
+        if target != root and not target.startswith(root + os.sep):
+            log.warning(
+                "Skipping archive member %s outside the extraction root",
+                info.filename,
+            )
+            continue
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+        else:
+            members.append((info, target))
+    if not members:
+        return
+
+    thread_data = threading.local()
+    # For in-memory archives, all worker threads read from this one shared
+    # buffer through per-thread _BufferReader cursors; copying the payload
+    # per worker (e.g. with BytesIO) would multiply peak memory by the pool
+    # size for large models
+    source_buffer = None if isinstance(zip_source, str) else zip_source.getbuffer()
+
+    def extract_member(member):
+        info, target = member
+        zip_handle = getattr(thread_data, "zip_handle", None)
+        if zip_handle is None:
+            zip_handle = thread_data.zip_handle = zipfile.ZipFile(
+                # pylint: disable=consider-using-with
+                open(zip_source, "rb", buffering=_ZIP_READ_BUFFER_SIZE)
+                if source_buffer is None
+                else _BufferReader(source_buffer),
+                "r",
+            )
+            thread_data.buffer = memoryview(bytearray(_EXTRACT_BUFFER_SIZE))
+        buffer = thread_data.buffer
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with zip_handle.open(info) as src, open(target, "wb") as dst:
+            while True:
+                read_size = src.readinto(buffer)
+                if not read_size:
+                    break
+                dst.write(buffer[:read_size])
+
+    max_workers = min(os.cpu_count() or 1, _MAX_EXTRACT_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Drain the iterator so that any exception raised in a worker
+        # propagates to the caller
+        list(executor.map(extract_member, members))
+
+
+def _find_archive_config(zip_f):
+    """Locate the archive member holding the model's `config.yml` by inspecting
+    the zip's central directory, without extracting anything. The config is
+    expected either at the root of the archive or inside a single top-level
+    directory created when zipping the model directory itself.
+
+    Args:
+        zip_f: zipfile.ZipFile
+            Open zip archive to probe.
+
+    Returns:
+        Optional[str]
+            The member name of the config file, or None if it could not be
+            found in the top two levels of the archive.
+    """
+    names = set(zip_f.namelist())
+    if "config.yml" in names:
+        return "config.yml"
+    # Omit anything starting with __ to avoid accidentally matching compression
+    # artifacts, e.g., __MACOSX.
+    top_level_dirs = {
+        name.split("/", 1)[0]
+        for name in names
+        if "/" in name and not name.startswith("__")
+    }
+    if len(top_level_dirs) == 1:
+        nested_name = "{}/config.yml".format(next(iter(top_level_dirs)))
+        if nested_name in names:
+            return nested_name
+    return None
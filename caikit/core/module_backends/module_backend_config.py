@@ -53,6 +53,14 @@ def configured_load_backends() -> List[BackendBase]:
     return copy.copy(_CONFIGURED_LOAD_BACKENDS)
 
 
+def config_version() -> int:
+    """This function returns a monotonically increasing token that is bumped
+    every time `configure` runs. Callers that derive state from the configured
+    backends can use it as a cheap cache-invalidation signal.
+    """
+    return _CONFIG_VERSION
+
+
 def configured_train_backends() -> List[BackendBase]:
     """This function returns the list of configured train backends"""
     return copy.copy(_CONFIGURED_TRAIN_BACKENDS)
@@ -63,6 +71,8 @@ def configure():
 
     NOTE: This function is NOT thread safe!
     """
+    global _CONFIG_VERSION
+    _CONFIG_VERSION += 1
     config_object = get_config().module_backends
     log.debug3("Full Config: %s", config_object)
 
@@ -138,6 +148,9 @@ def configure():
 _CONFIGURED_LOAD_BACKENDS = []
 _CONFIGURED_TRAIN_BACKENDS = []
 
+# Token bumped on every configure() call, exposed via config_version()
+_CONFIG_VERSION = 0
+
 
 def _configure_backend_overrides(backend: str, backend_instance: object):
     """Function to go over all the modules registered in the MODULE_BACKEND_REGISTRY
@@ -49,6 +49,12 @@ error = error_handler.get(log)
 class ModuleBase(metaclass=_ModuleBaseMeta):
     """Abstract base class from which all modules should inherit."""
 
+    # Modules whose `load` implementation only reads files beneath the given
+    # model path may set this to True to declare that they can be handed a
+    # `zipfile.Path` directly when loading from a zip archive, letting the
+    # model manager skip extraction to a temporary directory entirely.
+    SUPPORTS_ZIP_PATH = False
+
     def __init__(self):
         """Construct a new model."""
         # Set up an empty metadata dictionary, to be:
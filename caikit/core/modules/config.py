@@ -13,8 +13,14 @@
 # limitations under the License.
 
 # Standard
+from functools import lru_cache
+import copy
 import os
 import warnings
+import zipfile
+
+# Third Party
+import yaml
 
 # First Party
 import aconfig
@@ -28,6 +34,15 @@ log = alog.use_channel("MODULE_CFG")
 error = error_handler.get(log)
 
 
+@lru_cache(maxsize=64)
+def _load_config_dict(config_path, _mtime_ns):
+    """Parse a `config.yml` into a dict, cached on the file's path and mtime so
+    that repeated loads of the same on-disk config skip the yaml parse. The
+    mtime argument exists only to key the cache.
+    """
+    return toolkit.load_yaml(config_path)
+
+
 class ModuleConfig(aconfig.Config):
     """Config object used by all modules for config loading, saving, etc."""
 
@@ -88,17 +103,39 @@ class ModuleConfig(aconfig.Config):
         """Load a new module configuration from a directory on disk.
 
         Args:
-            model_path: str
+            model_path: str | zipfile.Path
                 Path to model directory. At the top level of directory is `config.yml` which holds
                 info about the model. Note that the model_path here is assumed to be operating
                 system correct as a consequence of the way this method is invoked by the model
-                manager.
+                manager. A zipfile.Path may be given for models being loaded directly from an
+                archive without extraction.
 
         Returns:
             BlockConfig
                 Instantiated BlockConfig for model given model_path.
         """
-        error.type_check("<COR71170339E>", str, model_path=model_path)
+        error.type_check("<COR71170339E>", str, zipfile.Path, model_path=model_path)
+
+        # For models read directly out of a zip archive, stream the config
+        # bytes rather than touching the filesystem
+        if isinstance(model_path, zipfile.Path):
+            config_file = model_path / "config.yml"
+            if not config_file.is_file():
+                # NOTE: Do not log this out with error handler; see below
+                raise FileNotFoundError(
+                    "Module path `{}` is not a directory with a `config.yml` file.".format(
+                        model_path
+                    )
+                )
+            # NOTE: str() requires the underlying archive to have a filename,
+            # which in-memory archives do not
+            try:
+                model_path_str = str(model_path)
+            except TypeError:
+                model_path_str = model_path.at
+            return cls.load_from_bytes(
+                config_file.read_bytes(), model_path=model_path_str
+            )
 
         # Validate config.yml
         config_path = os.path.join(model_path, "config.yml")
@@ -111,8 +148,11 @@ class ModuleConfig(aconfig.Config):
                 )
             )
 
-        # Read the yaml to dict and construct a new config object
-        config = cls(toolkit.load_yaml(config_path))
+        # Read the yaml to dict and construct a new config object. The parse
+        # is cached on (path, mtime), so a deep copy keeps callers that mutate
+        # their config from corrupting the cached dict.
+        config_dict = _load_config_dict(config_path, os.stat(config_path).st_mtime_ns)
+        config = cls(copy.deepcopy(config_dict))
 
         # Error if model_path was in the config
         if config.model_path is not None:
@@ -136,6 +176,89 @@ class ModuleConfig(aconfig.Config):
 
         return config
 
+    @classmethod
+    def load_header(cls, model_path, read_size=4096):
+        """Best-effort cheap peek at a module's `config.yml` that avoids the
+        full config load. Reads at most `read_size` bytes and parses them,
+        which covers the entire file for typical module configs. Callers that
+        need more than the top-level scalar fields (e.g. `module_id` and
+        `model_backend`) should use `load` instead.
+
+        Args:
+            model_path: str
+                Path to model directory holding a top-level `config.yml`.
+            read_size: int
+                Maximum number of bytes to read from the config file.
+
+        Returns:
+            Optional[dict]
+                The parsed config, or None if the file was larger than
+                `read_size` or could not be parsed. A None return is not an
+                error; callers should fall back to `load`.
+        """
+        error.type_check("<COR40398734E>", str, model_path=model_path)
+
+        # Validate config.yml the same way `load` does so that a missing
+        # config surfaces identically to callers
+        config_path = os.path.join(model_path, "config.yml")
+        if not (os.path.exists(config_path) and os.path.isfile(config_path)):
+            # NOTE: Do not log this out with error handler, as we might try this function multiple
+            # times in some special cases, e.g., when handling zip archives.
+            raise FileNotFoundError(
+                "Module path `{}` is not a directory with a `config.yml` file.".format(
+                    model_path
+                )
+            )
+
+        with open(config_path, "rb") as config_file:
+            header_bytes = config_file.read(read_size)
+        # Only trust complete reads; a truncated config could parse as valid
+        # yaml with a silently mangled trailing value
+        if len(header_bytes) == read_size:
+            return None
+        try:
+            parsed = yaml.safe_load(header_bytes)
+        except yaml.YAMLError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    @classmethod
+    def load_from_bytes(cls, config_bytes, model_path=None):
+        """Load a new module configuration from the serialized contents of a
+        `config.yml` file without requiring the file to exist on disk. This is
+        useful for peeking at a module's configuration while it is still held
+        in memory, e.g., inside a zip archive.
+
+        Args:
+            config_bytes: bytes
+                Raw contents of a `config.yml` file.
+            model_path: Optional[str]
+                If given, recorded as the `model_path` on the returned config
+                the same way `load` records the directory it read from.
+
+        Returns:
+            BlockConfig
+                Instantiated BlockConfig for the given config contents.
+        """
+        error.type_check("<COR41337352E>", bytes, config_bytes=config_bytes)
+
+        # Read the yaml to dict and construct a new config object. The reserved
+        # key validation in the constructor ensures model_path was not given.
+        config = cls(yaml.safe_load(config_bytes))
+
+        # Add the model path to the config object if one was given
+        if model_path is not None:
+            config["model_path"] = model_path
+
+        # Make sure module_id is found
+        if config.module_id is None:
+            error(
+                "<COR22369570E>",
+                KeyError("No module_id found in given config contents"),
+            )
+
+        return config
+
     def save(self, model_path):
         """Save this module configuration to a top-level `config.yml` file in the specified
         model path.
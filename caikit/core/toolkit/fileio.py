@@ -26,6 +26,15 @@ import shutil
 # Third Party
 import yaml
 
+# Use the libyaml C loader when available; it parses the same yaml roughly an
+# order of magnitude faster than the pure-Python loader
+try:
+    # Third Party
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover
+    # Third Party
+    from yaml import SafeLoader as _YamlSafeLoader
+
 
 def load_txt(filename):
     """Load a string from a file with utf8 encoding."""
@@ -103,7 +112,7 @@ def save_json(save_dict, filename, mode="w"):
 def load_yaml(filename):
     """Load a yaml file into a dictionary."""
     with open(filename, mode="r", encoding="utf8") as fh:
-        return yaml.safe_load(fh)
+        return yaml.load(fh, Loader=_YamlSafeLoader)
 
 
 def save_yaml(save_dict, filename, mode="w"):
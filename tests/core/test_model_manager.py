@@ -16,12 +16,15 @@ and download and load them.
 """
 
 # Standard
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from unittest import mock
 from unittest.mock import MagicMock
+import io
 import os
 import tempfile
 import uuid
+import zipfile
 
 # Local
 from caikit.core.module_backends import module_backend_config
@@ -101,6 +104,19 @@ class TestModelManager(TestCaseBase):
         # Pointers should be different, since cache was cleared in between
         self.assertNotEqual(id(model), id(model2))
 
+    def test_load_singleton_zip_hits_cache_without_reopening_archive(self):
+        model1 = caikit.core.load(self.module_archive_buffer, load_singleton=True)
+        # The second load should be served from the singleton cache without
+        # opening or extracting the archive at all
+        with mock.patch.object(
+            caikit.core.MODEL_MANAGER,
+            "_load_from_zipfile",
+            side_effect=AssertionError("archive should not be reopened"),
+        ):
+            model2 = caikit.core.load(self.module_archive_buffer, load_singleton=True)
+        assert model1 is model2
+        caikit.core.MODEL_MANAGER.clear_singleton_cache()
+
     def test_load_raises_on_bad_paths(self):
         with self.assertRaises(FileNotFoundError):
             caikit.core.load("bad/path/to/model")
@@ -336,6 +352,20 @@ def test_singleton_cache_can_be_cleared(reset_globals):
     assert len(caikit.core.MODEL_MANAGER.get_singleton_model_cache_info()) == 0
 
 
+def test_concurrent_singleton_loads_return_the_same_model(reset_globals):
+    """Concurrent singleton loads of the same path all get one instance"""
+    _ = setup_saved_model(MockBackend)
+    dummy_model_path = os.path.join(TEST_DATA_PATH, DUMMY_BACKEND_MODEL_NAME)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        models = list(
+            executor.map(
+                lambda _: caikit.core.load(dummy_model_path, load_singleton=True),
+                range(16),
+            )
+        )
+    assert len({id(model) for model in models}) == 1
+
+
 def test_singleton_cache_with_different_backend(reset_globals):
     """Test singleton cache doesn't stop different backend models"""
 
@@ -517,6 +547,32 @@ def test_load_must_return_model():
             caikit.core.load(tempdir)
 
 
+def test_load_zip_without_extraction_when_module_supports_zip_path(reset_globals):
+    """A module that opts into SUPPORTS_ZIP_PATH is handed a zipfile.Path
+    rooted at the model directory instead of an extracted temp directory
+    """
+    received = {}
+
+    @caikit.core.modules.module(
+        id="zip-path-mod", name="zip path mod", version="0.0.1", task=SampleTask
+    )
+    class ZipPathModule(caikit.core.ModuleBase):
+        SUPPORTS_ZIP_PATH = True
+
+        @classmethod
+        def load(cls, model_path, **kwargs):
+            received["model_path"] = model_path
+            return cls()
+
+    archive_buffer = io.BytesIO()
+    with zipfile.ZipFile(archive_buffer, "w") as zip_f:
+        zip_f.writestr("config.yml", "module_id: zip-path-mod\n")
+
+    model = caikit.core.load(archive_buffer.getvalue())
+    assert isinstance(model, ZipPathModule)
+    assert isinstance(received["model_path"], zipfile.Path)
+
+
 def test_load_with_new_shared_backend(good_model_path, reset_globals):
     """If a shared laod backend has higher priority than LOCAL, it is used"""
     loader_name = str(uuid.uuid4())